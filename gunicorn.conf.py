@@ -6,22 +6,32 @@ Optimized for Railway/cloud deployment with SSL/TLS support.
 import multiprocessing
 import os
 
+_debug = os.getenv('DEBUG', 'False').lower() == 'true'
+
 # Server socket
 bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
 backlog = 2048
 
 # Worker processes
-workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
-worker_class = 'sync'
+# Views mostly wait on the database, so each worker runs a small thread pool
+# (gthread) instead of one request at a time; fewer processes are needed.
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() + 1))
+worker_class = os.getenv('WORKER_CLASS', 'gthread')
+threads = int(os.getenv('THREADS', '4'))
 worker_connections = 1000
 max_requests = 1000
 max_requests_jitter = 50
-threads = 1
 
 # Timeouts - Increased to prevent SSL handshake timeouts
 timeout = 120  # Worker timeout (increased from default 30s)
 graceful_timeout = 30
-keepalive = 5  # Keep-alive connections to reduce SSL handshake overhead
+# Keep-alive connections to reduce SSL handshake overhead. Must stay below
+# the upstream proxy's idle timeout, otherwise the proxy may reuse a socket
+# gunicorn has already closed.
+keepalive = 5
+
+# Worker heartbeat file on tmpfs instead of the container's disk
+worker_tmp_dir = '/dev/shm'
 
 # Request size limits - Increase for batch operations
 limit_request_line = 8190
@@ -53,8 +63,7 @@ secure_scheme_headers = {
     'X-FORWARDED-SSL': 'on'
 }
 
-# Preload app for better performance
-preload_app = True
-
-# Reload on code change (disable in production)
-reload = os.getenv('DEBUG', 'False') == 'True'
+# Preload app so workers share the imported Django app via copy-on-write.
+# Reload on code change only in development, where preload would defeat it.
+preload_app = not _debug
+reload = _debug
@@ -1,5 +1,14 @@
 from django.contrib import admin
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.db.models import Case, CharField, Q, Value, When
+from django.db.models.functions import Concat
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from .models import (
     UserProfile,
     SubscriptionPackage,
@@ -8,9 +17,153 @@ from .models import (
     SubscriptionPayment,
     BotAPIKey,
     BotStrategy,
-    BacktestResult
+    BacktestResult,
+    PaymentStatus,
+    PositionStatus,
+    CloseReason
 )
-import secrets
+import csv
+import itertools
+
+
+# Changelist cell markup. Only color names and numbers formatted by the
+# display methods are interpolated, so the output needs no escaping.
+BAHT_AMOUNT_HTML = '<span style="color: {}; font-weight: bold;">฿{}</span>'
+COLORED_VALUE_HTML = '<span style="color: {}; font-weight: bold;">{}</span>'
+COLORED_PERCENT_HTML = '<span style="color: {}; font-weight: bold;">{}%</span>'
+DRAWDOWN_HTML = '<span style="color: red;">{} ({}%)</span>'
+
+
+# Columns written by the trade CSV export, as (header, lookup) pairs
+TRADE_EXPORT_COLUMNS = [
+    ('MT5 Order ID', 'mt5_order_id'),
+    ('MT5 Account ID', 'trade_account__mt5_account_id'),
+    ('Username', 'trade_account__user__username'),
+    ('Bot Strategy', 'bot_strategy__name'),
+    ('Symbol', 'symbol'),
+    ('Position Type', 'position_type'),
+    ('Position Status', 'position_status'),
+    ('Close Reason', 'close_reason'),
+    ('Lot Size', 'lot_size'),
+    ('Entry Price', 'entry_price'),
+    ('Exit Price', 'exit_price'),
+    ('Profit/Loss', 'profit_loss'),
+    ('Commission', 'commission'),
+    ('Swap Fee', 'swap_fee'),
+    ('Opened At', 'opened_at'),
+    ('Closed At', 'closed_at'),
+    ('Comment', 'comment'),
+]
+
+
+class Echo:
+    """Pseudo-buffer whose write() returns the line, so csv.writer can feed a streaming response"""
+
+    def write(self, value):
+        return value
+
+
+def is_changelist_request(request):
+    """Whether the admin request is for a changelist page rather than a single object"""
+    match = request.resolver_match
+    return match is not None and (match.url_name or '').endswith('_changelist')
+
+
+class ChangelistDeferMixin:
+    """Defer the list_defer columns on changelist requests, which never render them"""
+    list_defer = []
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self.list_defer and is_changelist_request(request):
+            queryset = queryset.defer(*self.list_defer)
+        return queryset
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses PostgreSQL's planner row estimate for unfiltered changelists.
+    Filtered or searched lists, other databases and never-analyzed tables fall back to COUNT(*).
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
+
+
+class CachedChoicesListFilter(admin.SimpleListFilter):
+    """
+    List filter whose choices are cached instead of queried on every changelist page.
+    By default the choices are the distinct values of parameter_name on choices_model.
+    The cache is per process, so choices are only refreshed when cache_timeout expires;
+    a new or renamed value can take that long to show up in every worker.
+    """
+    cache_key = None
+    cache_timeout = 300
+    choices_model = None
+
+    def lookups(self, request, model_admin):
+        return cache.get_or_set(self.cache_key, self.load_choices, self.cache_timeout)
+
+    def load_choices(self):
+        values = self.choices_model.objects.order_by(self.parameter_name).values_list(
+            self.parameter_name, flat=True
+        ).distinct()
+        return [(value, value) for value in values]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.parameter_name: self.value()})
+        return queryset
+
+
+class BotStrategyListFilter(CachedChoicesListFilter):
+    title = 'bot strategy'
+    parameter_name = 'bot_strategy'
+    cache_key = 'admin:bot_strategy_choices'
+    empty_value = 'none'
+
+    def lookups(self, request, model_admin):
+        # Trades synced without a recognised strategy comment have no bot_strategy
+        return super().lookups(request, model_admin) + [(self.empty_value, model_admin.get_empty_value_display())]
+
+    def load_choices(self):
+        strategies = BotStrategy.objects.only('name', 'version', 'is_pair_trading', 'status').order_by('name')
+        return [(strategy.pk, str(strategy)) for strategy in strategies]
+
+    def queryset(self, request, queryset):
+        if self.value() == self.empty_value:
+            return queryset.filter(bot_strategy__isnull=True)
+        if self.value():
+            return queryset.filter(bot_strategy_id=self.value())
+        return queryset
+
+
+class BrokerListFilter(CachedChoicesListFilter):
+    title = 'broker name'
+    parameter_name = 'broker_name'
+    cache_key = 'admin:broker_name_choices'
+    cache_timeout = 600
+    choices_model = UserTradeAccount
+
+
+class SymbolListFilter(CachedChoicesListFilter):
+    title = 'symbol'
+    parameter_name = 'symbol'
+    cache_key = 'admin:trade_symbol_choices'
+    cache_timeout = 900
+    choices_model = TradeTransaction
 
 
 @admin.register(UserProfile)
@@ -19,6 +172,7 @@ class UserProfileAdmin(admin.ModelAdmin):
     list_filter = ['is_active', 'created_at']
     search_fields = ['user__username', 'first_name', 'last_name', 'line_uuid', 'phone_number']
     readonly_fields = ['created_at', 'updated_at']
+    list_select_related = ['user']
     ordering = ['-created_at']
 
 
@@ -36,7 +190,7 @@ class SubscriptionPackageAdmin(admin.ModelAdmin):
 
 
 @admin.register(UserTradeAccount)
-class UserTradeAccountAdmin(admin.ModelAdmin):
+class UserTradeAccountAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = [
         'account_name', 
         'user', 
@@ -48,11 +202,20 @@ class UserTradeAccountAdmin(admin.ModelAdmin):
         'balance_display',
         'subscription_expiry'
     ]
-    list_filter = ['subscription_status', 'bot_status', 'broker_name', 'is_active', 'created_at']
+    list_filter = ['subscription_status', 'bot_status', BrokerListFilter, 'subscription_expiry', 'is_active', 'created_at']
     search_fields = ['account_name', 'user__username', 'mt5_account_id', 'broker_name']
     readonly_fields = ['created_at', 'updated_at', 'last_sync_datetime']
-    raw_id_fields = ['user', 'subscription_package', 'active_bot']
-    date_hierarchy = 'subscription_expiry'
+    autocomplete_fields = ['user', 'subscription_package', 'active_bot']
+    list_select_related = ['user', 'active_bot']
+    list_defer = [
+        'mt5_password',
+        'trade_config',
+        'active_bot__description',
+        'active_bot__allowed_symbols',
+        'active_bot__optimization_config',
+        'active_bot__current_parameters'
+    ]
+    show_full_result_count = False
     ordering = ['-created_at']
 
     fieldsets = (
@@ -79,9 +242,13 @@ class UserTradeAccountAdmin(admin.ModelAdmin):
         return f"฿{obj.current_balance:,.2f}"
     balance_display.short_description = 'Current Balance'
 
+    def get_queryset(self, request):
+        """Load the owner everywhere, since __str__ reads it for autocomplete results and object titles"""
+        return super().get_queryset(request).select_related('user')
+
 
 @admin.register(TradeTransaction)
-class TradeTransactionAdmin(admin.ModelAdmin):
+class TradeTransactionAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = [
         'mt5_order_id',
         'trade_account',
@@ -96,12 +263,23 @@ class TradeTransactionAdmin(admin.ModelAdmin):
         'opened_at',
         'closed_at'
     ]
-    list_filter = ['position_status', 'position_type', 'close_reason', 'bot_strategy', 'symbol', 'opened_at']
-    search_fields = ['mt5_order_id', 'symbol', 'trade_account__account_name', 'trade_account__user__username', 'bot_strategy__name', 'comment']
+    list_filter = ['position_status', 'position_type', 'close_reason', BotStrategyListFilter, SymbolListFilter, 'opened_at']
+    search_fields = ['symbol', 'trade_account__account_name', 'trade_account__user__username', 'bot_strategy__name', 'comment']
     readonly_fields = ['created_at', 'updated_at']
-    raw_id_fields = ['trade_account', 'bot_strategy']
-    date_hierarchy = 'opened_at'
+    autocomplete_fields = ['trade_account', 'bot_strategy']
+    list_select_related = ['trade_account__user', 'bot_strategy']
+    list_defer = [
+        'trade_account__mt5_password',
+        'trade_account__trade_config',
+        'bot_strategy__description',
+        'bot_strategy__allowed_symbols',
+        'bot_strategy__optimization_config',
+        'bot_strategy__current_parameters'
+    ]
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     ordering = ['-opened_at']
+    actions = ['export_csv', 'close_positions']
 
     fieldsets = (
         ('Trade Information', {
@@ -122,19 +300,65 @@ class TradeTransactionAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Let the database pick the P&L color for the changelist rows"""
+        queryset = super().get_queryset(request)
+        if is_changelist_request(request):
+            queryset = queryset.annotate(
+                pnl_color=Case(
+                    When(profit_loss__gte=0, then=Value('green')),
+                    default=Value('red'),
+                    output_field=CharField()
+                )
+            )
+        return queryset
+
     def pnl_display(self, obj):
-        color = 'green' if obj.profit_loss >= 0 else 'red'
-        pnl_value = f'{obj.profit_loss:,.2f}'
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">฿{}</span>',
-            color,
-            pnl_value
-        )
+        return mark_safe(BAHT_AMOUNT_HTML.format(obj.pnl_color, f'{obj.profit_loss:,.2f}'))
     pnl_display.short_description = 'P&L'
 
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        """Load the account owner with trade_account, which its __str__ reads"""
+        if db_field.name == 'trade_account':
+            kwargs['queryset'] = UserTradeAccount.objects.select_related('user')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+    def get_search_results(self, request, queryset, search_term):
+        """Also match numeric terms as an exact MT5 ticket using the mt5_order_id index"""
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        term = search_term.strip()
+        if term.isascii() and term.isdigit() and len(term) <= 18:
+            results |= queryset.filter(mt5_order_id=int(term))
+        return results, may_have_duplicates
+
+    @admin.action(description='Export selected trades to CSV')
+    def export_csv(self, request, queryset):
+        """Stream the selected trades as CSV rows fetched in chunks rather than all at once"""
+        writer = csv.writer(Echo())
+        rows = queryset.values_list(*[lookup for _, lookup in TRADE_EXPORT_COLUMNS]).iterator(chunk_size=2000)
+        lines = itertools.chain(
+            [writer.writerow([header for header, _ in TRADE_EXPORT_COLUMNS])],
+            (writer.writerow(row) for row in rows)
+        )
+        response = StreamingHttpResponse(lines, content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="trades.csv"'
+        return response
+
+    @admin.action(description='Close selected open positions')
+    def close_positions(self, request, queryset):
+        """Mark the selected open trades as manually closed in a single UPDATE"""
+        now = timezone.now()
+        closed = queryset.filter(position_status=PositionStatus.OPEN).update(
+            position_status=PositionStatus.CLOSED,
+            close_reason=CloseReason.MANUAL,
+            closed_at=now,
+            updated_at=now
+        )
+        self.message_user(request, f"Closed {closed} open position(s).")
+
 
 @admin.register(SubscriptionPayment)
-class SubscriptionPaymentAdmin(admin.ModelAdmin):
+class SubscriptionPaymentAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = [
         'user',
         'trade_account',
@@ -153,8 +377,12 @@ class SubscriptionPaymentAdmin(admin.ModelAdmin):
         'subscription_package__name'
     ]
     readonly_fields = ['created_at', 'updated_at', 'slip_preview']
-    raw_id_fields = ['user', 'trade_account', 'subscription_package', 'verified_by']
-    date_hierarchy = 'payment_date'
+    autocomplete_fields = ['user', 'trade_account', 'subscription_package', 'verified_by']
+    list_select_related = ['user', 'trade_account__user', 'subscription_package']
+    list_defer = ['admin_notes', 'trade_account__mt5_password', 'trade_account__trade_config']
+    actions = ['mark_completed']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     ordering = ['-payment_date']
 
     fieldsets = (
@@ -175,31 +403,50 @@ class SubscriptionPaymentAdmin(admin.ModelAdmin):
 
     def amount_display(self, obj):
         color = 'green' if obj.payment_status == 'COMPLETED' else 'orange'
-        amount_value = f'{obj.payment_amount:,.2f}'
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">฿{}</span>',
-            color,
-            amount_value
-        )
+        return mark_safe(BAHT_AMOUNT_HTML.format(color, f'{obj.payment_amount:,.2f}'))
     amount_display.short_description = 'Amount (THB)'
 
+    @admin.action(description='Mark selected payments as completed')
+    def mark_completed(self, request, queryset):
+        """
+        Complete the selected payments one save() at a time, because the pre_save
+        signal activates each trade account; a bulk update() would skip it.
+        """
+        payments = queryset.exclude(payment_status=PaymentStatus.COMPLETED).defer(None).select_related(
+            'trade_account',
+            'subscription_package'
+        )
+        with transaction.atomic():
+            for payment in payments:
+                payment.payment_status = PaymentStatus.COMPLETED
+                payment.verified_by = request.user
+                payment.save(update_fields=['payment_status', 'verified_by', 'verified_at', 'updated_at'])
+        self.message_user(request, f"Marked {len(payments)} payment(s) as completed.")
+
     def slip_preview(self, obj):
         if obj.payment_slip:
             return format_html(
-                '<a href="{}" target="_blank"><img src="{}" style="max-width: 200px; max-height: 200px;"/></a>',
+                '<a href="{}" target="_blank"><img loading="lazy" decoding="async" src="{}" style="max-width: 200px; max-height: 200px;"/></a>',
                 obj.payment_slip.url,
                 obj.payment_slip.url
             )
         return "No slip uploaded"
     slip_preview.short_description = 'Payment Slip Preview'
 
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        """Load the account owner with trade_account, which its __str__ reads"""
+        if db_field.name == 'trade_account':
+            kwargs['queryset'] = UserTradeAccount.objects.select_related('user')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 
 @admin.register(BotAPIKey)
-class BotAPIKeyAdmin(admin.ModelAdmin):
+class BotAPIKeyAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = ['name', 'key_display', 'is_active', 'last_used', 'created_at']
     list_filter = ['is_active', 'created_at', 'last_used']
-    search_fields = ['name', 'key']
+    search_fields = ['name']
     readonly_fields = ['key', 'created_at', 'updated_at', 'last_used']
+    list_defer = ['key']
     ordering = ['-created_at']
     
     fieldsets = [
@@ -216,29 +463,30 @@ class BotAPIKeyAdmin(admin.ModelAdmin):
         })
     ]
     
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Also match the start of the masked key ends. Keys are case-sensitive, and a plain
+        startswith can use the key_prefix/key_suffix indexes where istartswith cannot.
+        """
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        term = search_term.strip()
+        if term:
+            results |= queryset.filter(Q(key_prefix__startswith=term) | Q(key_suffix__startswith=term))
+        return results, may_have_duplicates
+    
     def key_display(self, obj):
         """Show masked API key for security"""
+        if obj.key_prefix:
+            return f"{obj.key_prefix}...{obj.key_suffix}"
+        # Rows written without save(), e.g. raw fixtures; loads the deferred key
         if obj.key:
             return f"{obj.key[:8]}...{obj.key[-8:]}"
         return "-"
     key_display.short_description = 'API Key'
-    
-    def save_model(self, request, obj, form, change):
-        """Auto-generate API key on creation"""
-        if not change:  # Only on creation
-            obj.key = secrets.token_urlsafe(48)
-        super().save_model(request, obj, form, change)
-    
-    def get_readonly_fields(self, request, obj=None):
-        """Make key readonly after creation"""
-        if obj:  # Editing existing object
-            return self.readonly_fields
-        else:  # Creating new object
-            return ['created_at', 'updated_at', 'last_used']
 
 
 @admin.register(BotStrategy)
-class BotStrategyAdmin(admin.ModelAdmin):
+class BotStrategyAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = [
         'name',
         'version',
@@ -254,7 +502,8 @@ class BotStrategyAdmin(admin.ModelAdmin):
     list_filter = ['status', 'strategy_type', 'bot_strategy_class', 'is_pair_trading', 'is_active', 'created_at', 'last_backtest_date']
     search_fields = ['name', 'description', 'strategy_type', 'bot_strategy_class', 'version']
     readonly_fields = ['created_at', 'updated_at', 'last_backtest_date', 'last_optimization_date']
-    filter_horizontal = ['allowed_packages']
+    autocomplete_fields = ['allowed_packages']
+    list_defer = ['description', 'allowed_symbols', 'optimization_config', 'current_parameters']
     ordering = ['-created_at']
 
     fieldsets = (
@@ -280,7 +529,7 @@ class BotStrategyAdmin(admin.ModelAdmin):
 
 
 @admin.register(BacktestResult)
-class BacktestResultAdmin(admin.ModelAdmin):
+class BacktestResultAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = [
         'bot_strategy',
         'run_date',
@@ -295,8 +544,16 @@ class BacktestResultAdmin(admin.ModelAdmin):
     list_filter = ['is_latest', 'is_active', 'run_date', 'bot_strategy__status']
     search_fields = ['bot_strategy__name']
     readonly_fields = ['created_at', 'updated_at', 'equity_curve_preview', 'comprehensive_analysis_preview', 'trading_graph_preview']
-    raw_id_fields = ['bot_strategy']
-    date_hierarchy = 'run_date'
+    autocomplete_fields = ['bot_strategy']
+    list_select_related = ['bot_strategy']
+    list_defer = [
+        'raw_data',
+        'bot_strategy__description',
+        'bot_strategy__allowed_symbols',
+        'bot_strategy__optimization_config',
+        'bot_strategy__current_parameters'
+    ]
+    show_full_result_count = False
     ordering = ['-run_date']
 
     fieldsets = (
@@ -329,44 +586,55 @@ class BacktestResultAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Let the database build the test period label and pick the colors for the changelist rows"""
+        queryset = super().get_queryset(request)
+        if is_changelist_request(request):
+            queryset = queryset.annotate(
+                win_rate_color=Case(
+                    When(win_rate__gte=50, then=Value('green')),
+                    When(win_rate__gte=40, then=Value('orange')),
+                    default=Value('red'),
+                    output_field=CharField()
+                ),
+                total_profit_color=Case(
+                    When(total_profit__gte=0, then=Value('green')),
+                    default=Value('red'),
+                    output_field=CharField()
+                ),
+                test_period=Concat(
+                    'backtest_start_date',
+                    Value(' to '),
+                    'backtest_end_date',
+                    output_field=CharField()
+                )
+            )
+        return queryset
+
     def date_range(self, obj):
-        return f"{obj.backtest_start_date} to {obj.backtest_end_date}"
+        return obj.test_period
     date_range.short_description = 'Test Period'
+    date_range.admin_order_field = 'backtest_start_date'
 
     def win_rate_display(self, obj):
-        color = 'green' if obj.win_rate >= 50 else 'orange' if obj.win_rate >= 40 else 'red'
-        win_rate_formatted = f'{obj.win_rate:.2f}'
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}%</span>',
-            color,
-            win_rate_formatted
-        )
+        return mark_safe(COLORED_PERCENT_HTML.format(obj.win_rate_color, f'{obj.win_rate:.2f}'))
     win_rate_display.short_description = 'Win Rate'
 
     def total_profit_display(self, obj):
-        color = 'green' if obj.total_profit >= 0 else 'red'
-        profit_formatted = f'{float(obj.total_profit):,.2f}'
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            profit_formatted
-        )
+        return mark_safe(COLORED_VALUE_HTML.format(obj.total_profit_color, f'{float(obj.total_profit):,.2f}'))
     total_profit_display.short_description = 'Total Profit'
 
     def max_drawdown_display(self, obj):
-        drawdown_formatted = f'{float(obj.max_drawdown):,.2f}'
-        drawdown_pct_formatted = f'{float(obj.max_drawdown_percent):.2f}'
-        return format_html(
-            '<span style="color: red;">{} ({}%)</span>',
-            drawdown_formatted,
-            drawdown_pct_formatted
-        )
+        return mark_safe(DRAWDOWN_HTML.format(
+            f'{float(obj.max_drawdown):,.2f}',
+            f'{float(obj.max_drawdown_percent):.2f}'
+        ))
     max_drawdown_display.short_description = 'Max Drawdown'
 
     def equity_curve_preview(self, obj):
         if obj.equity_curve_image:
             return format_html(
-                '<a href="{}" target="_blank"><img src="{}" style="max-width: 400px; max-height: 300px;"/></a>',
+                '<a href="{}" target="_blank"><img loading="lazy" decoding="async" src="{}" style="max-width: 400px; max-height: 300px;"/></a>',
                 obj.equity_curve_image.url,
                 obj.equity_curve_image.url
             )
@@ -376,7 +644,7 @@ class BacktestResultAdmin(admin.ModelAdmin):
     def comprehensive_analysis_preview(self, obj):
         if obj.comprehensive_analysis_image:
             return format_html(
-                '<a href="{}" target="_blank"><img src="{}" style="max-width: 400px; max-height: 300px;"/></a>',
+                '<a href="{}" target="_blank"><img loading="lazy" decoding="async" src="{}" style="max-width: 400px; max-height: 300px;"/></a>',
                 obj.comprehensive_analysis_image.url,
                 obj.comprehensive_analysis_image.url
             )
@@ -386,7 +654,7 @@ class BacktestResultAdmin(admin.ModelAdmin):
     def trading_graph_preview(self, obj):
         if obj.trading_graph_image:
             return format_html(
-                '<a href="{}" target="_blank"><img src="{}" style="max-width: 400px; max-height: 300px;"/></a>',
+                '<a href="{}" target="_blank"><img loading="lazy" decoding="async" src="{}" style="max-width: 400px; max-height: 300px;"/></a>',
                 obj.trading_graph_image.url,
                 obj.trading_graph_image.url
             )
@@ -5,6 +5,9 @@ from django.utils import timezone
 from trading.models import BotAPIKey
 
 
+LAST_USED_UPDATE_INTERVAL = 60  # seconds
+
+
 def require_bot_api_key(view_func):
     """
     Decorator to validate master Bot API key from request header.
@@ -24,28 +27,29 @@ def require_bot_api_key(view_func):
         
         api_key = auth_header.split('Bearer ')[1].strip()
         
-        try:
-            # Find active API key
-            bot_key = BotAPIKey.objects.get(
-                key=api_key,
-                is_active=True
-            )
-            
-            # Update last used timestamp
-            bot_key.last_used = timezone.now()
-            bot_key.save(update_fields=['last_used'])
-            
-            # Mark request as bot-authenticated
-            request.is_bot_authenticated = True
-            request.bot_api_key = bot_key
-            
-            # Call the actual view
-            return view_func(request, *args, **kwargs)
-            
-        except BotAPIKey.DoesNotExist:
+        # Looked up on every request so deactivating or deleting a key takes effect immediately
+        bot_key = BotAPIKey.objects.only('id', 'name', 'last_used').filter(
+            key=api_key,
+            is_active=True
+        ).first()
+        
+        if bot_key is None:
             return JsonResponse({
                 'status': 'error',
                 'message': 'Invalid or inactive API key'
             }, status=401)
+        
+        # Update last used timestamp, at most once per interval
+        now = timezone.now()
+        if bot_key.last_used is None or (now - bot_key.last_used).total_seconds() >= LAST_USED_UPDATE_INTERVAL:
+            BotAPIKey.objects.filter(pk=bot_key.pk).update(last_used=now)
+            bot_key.last_used = now
+        
+        # Mark request as bot-authenticated
+        request.is_bot_authenticated = True
+        request.bot_api_key = bot_key
+        
+        # Call the actual view
+        return view_func(request, *args, **kwargs)
     
     return wrapper
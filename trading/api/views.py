@@ -1,4 +1,4 @@
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
@@ -10,22 +10,159 @@ from trading.models import (
     TradeTransaction, 
     UserTradeAccount, 
     BotStrategy, 
-    BacktestResult
+    BacktestResult,
+    PositionType,
+    PositionStatus,
+    CloseReason,
+    BotStatus,
+    DDBlockReason
 )
 from .authentication import require_bot_api_key
-import json
+import orjson
 import logging
 import sys
 from datetime import datetime, date
 
 logger = logging.getLogger(__name__)
 
+# Choice labels, looked up directly instead of per-row get_FOO_display() calls
+POSITION_TYPE_LABELS = dict(PositionType.choices)
+CLOSE_REASON_LABELS = dict(CloseReason.choices)
+BOT_STATUS_LABELS = dict(BotStatus.choices)
+DD_BLOCK_REASON_LABELS = dict(DDBlockReason.choices)
 
-def get_bot_strategy_from_comment(comment, trade_account):
+# Accepted enum values for incoming bot data. Tuples rather than sets, so a
+# malformed unhashable value (e.g. a JSON list) fails validation instead of raising.
+VALID_POSITION_TYPES = tuple(PositionType.values)
+VALID_POSITION_STATUSES = tuple(PositionStatus.values)
+VALID_CLOSE_REASONS = tuple(CloseReason.values)
+# Batch syncs also pass through the close reasons MT5 reports for terminal closes
+VALID_BATCH_CLOSE_REASONS = VALID_CLOSE_REASONS + ('Mobile', 'Web', 'Expert')
+VALID_BOT_STATUSES = tuple(BotStatus.values)
+VALID_DD_BLOCK_REASONS = tuple(DDBlockReason.values)
+
+# Fields a batch order update may change, written with bulk_update
+BATCH_ORDER_UPDATE_FIELDS = [
+    'position_status',
+    'closed_at',
+    'close_reason',
+    'comment',
+    'exit_price',
+    'take_profit',
+    'stop_loss',
+    'profit_loss',
+    'commission',
+    'swap_fee',
+    'entry_price',
+    'lot_size',
+    'account_balance_at_close',
+    'updated_at',
+]
+
+
+# Order decimal fields: the first group is skipped when falsy (0 means "not sent"),
+# the second is kept whenever present since zero is a meaningful value
+ORDER_PRICE_FIELDS = (
+    'entry_price',
+    'lot_size',
+    'exit_price',
+    'take_profit',
+    'stop_loss',
+    'account_balance_at_close',
+)
+ORDER_AMOUNT_FIELDS = (
+    'profit_loss',
+    'commission',
+    'swap_fee',
+)
+# Zero for omitted order amounts and empty P&L sums; Decimal is immutable, so one instance is shared
+ZERO_AMOUNT = Decimal('0.0000')
+# Fields a new order must include (updates may send any subset)
+ORDER_CREATE_REQUIRED_FIELDS = ('symbol', 'position_type', 'opened_at', 'entry_price', 'lot_size')
+# Free-text order fields whose length is checked against the column before a batch write
+ORDER_TEXT_FIELDS = ('symbol', 'comment')
+# Largest value a BigIntegerField (mt5_order_id) can hold
+MT5_ORDER_ID_MAX = 2 ** 63 - 1
+
+
+def json_response(payload, status=200):
+    """JsonResponse equivalent encoded with orjson; Decimals and lazy strings are sent via str()"""
+    return HttpResponse(
+        orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS),
+        content_type='application/json',
+        status=status
+    )
+
+
+def _to_decimal(value):
+    """Convert a JSON value to Decimal; strings and ints skip the str() roundtrip"""
+    if type(value) in (str, int):
+        return Decimal(value)
+    # Floats (and anything else) go through str() to keep their short repr
+    return Decimal(str(value))
+
+
+def parse_order_decimals(data):
+    """
+    Convert the provided price/amount fields of an order payload to Decimal.
+    Raises ValueError or InvalidOperation on malformed values.
+    """
+    decimal_fields = {}
+    for field in ORDER_PRICE_FIELDS:
+        value = data.get(field)
+        if value:
+            decimal_fields[field] = _to_decimal(value)
+    for field in ORDER_AMOUNT_FIELDS:
+        value = data.get(field)
+        if value is not None:
+            decimal_fields[field] = _to_decimal(value)
+    return decimal_fields
+
+
+def parse_order_id(value):
+    """MT5 ticket from an order payload as an int, or None if it is not a whole number that fits the column"""
+    if isinstance(value, str) and value.isascii() and value.strip().isdigit():
+        value = int(value)
+    if isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= MT5_ORDER_ID_MAX:
+        return value
+    return None
+
+
+def decimal_fits(value, field):
+    """Whether value can be stored in the DecimalField once rounded to its decimal places"""
+    if not value.is_finite():
+        return False
+    try:
+        rounded = value.quantize(Decimal(1).scaleb(-field.decimal_places))
+    except InvalidOperation:
+        return False
+    return rounded.is_zero() or rounded.adjusted() < field.max_digits - field.decimal_places
+
+
+def order_limit_error(order_data, decimal_fields):
+    """
+    Return an error message if an order value would overflow its TradeTransaction column,
+    so a bad order fails on its own instead of aborting the batch write.
+    """
+    for name, value in decimal_fields.items():
+        if not decimal_fits(value, TradeTransaction._meta.get_field(name)):
+            return f"{name} is out of range"
+    for name in ORDER_TEXT_FIELDS:
+        value = order_data.get(name)
+        max_length = TradeTransaction._meta.get_field(name).max_length
+        if value is not None and len(str(value)) > max_length:
+            return f"{name} is longer than {max_length} characters"
+    return None
+
+
+def get_bot_strategy_from_comment(comment, trade_account, strategy_cache=None):
     """
     Parse comment field to extract bot strategy ID and find the BotStrategy instance.
     Comment format: ID_StrategyName_Symbol (e.g., 5_MeanReversion_EURUSD)
     
+    strategy_cache, if given, memoizes lookups by ID (misses included) so a
+    batch only queries each strategy once.
+    
     Returns:
         BotStrategy instance or falls back to active_bot if not found
     """
@@ -33,24 +170,21 @@ def get_bot_strategy_from_comment(comment, trade_account):
         return trade_account.active_bot
     
     try:
-        parts = comment.split('_')
-        if not parts or len(parts) < 1:
-            return trade_account.active_bot
-        
-        bot_strategy_id_str = parts[0].strip()
-        
-        try:
-            bot_strategy_id = int(bot_strategy_id_str)
-            bot_strategy = BotStrategy.objects.get(
-                id=bot_strategy_id,
-                is_active=True
-            )
-            return bot_strategy
-        except (ValueError, BotStrategy.DoesNotExist):
-            return trade_account.active_bot
-        
-    except Exception:
+        bot_strategy_id = int(comment.split('_')[0].strip())
+    except (AttributeError, ValueError):
         return trade_account.active_bot
+    
+    if strategy_cache is not None and bot_strategy_id in strategy_cache:
+        bot_strategy = strategy_cache[bot_strategy_id]
+    else:
+        bot_strategy = BotStrategy.objects.filter(
+            id=bot_strategy_id,
+            is_active=True
+        ).first()
+        if strategy_cache is not None:
+            strategy_cache[bot_strategy_id] = bot_strategy
+    
+    return bot_strategy or trade_account.active_bot
 
 
 @require_http_methods(["POST"])
@@ -61,9 +195,9 @@ def create_update_order(request):
     Bot sends mt5_account_id to identify which account the order belongs to.
     """
     try:
-        data = json.loads(request.body)
-    except json.JSONDecodeError:
-        return JsonResponse({
+        data = orjson.loads(request.body)
+    except orjson.JSONDecodeError:
+        return json_response({
             'status': 'error',
             'message': 'Invalid JSON data'
         }, status=400)
@@ -77,7 +211,7 @@ def create_update_order(request):
             errors[field] = ['This field is required']
     
     if errors:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Invalid data',
             'errors': errors
@@ -85,12 +219,12 @@ def create_update_order(request):
     
     # Find the trade account by MT5 account ID
     try:
-        trade_account = UserTradeAccount.objects.get(
+        trade_account = UserTradeAccount.objects.only('id', 'mt5_account_id', 'active_bot').get(
             mt5_account_id=str(data['mt5_account_id']),
             is_active=True
         )
     except UserTradeAccount.DoesNotExist:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': f"Trade account {data['mt5_account_id']} not found"
         }, status=404)
@@ -105,13 +239,12 @@ def create_update_order(request):
     except TradeTransaction.DoesNotExist:
         is_update = False
         # For new orders, these fields are required
-        create_required_fields = ['symbol', 'position_type', 'opened_at', 'entry_price', 'lot_size']
-        for field in create_required_fields:
+        for field in ORDER_CREATE_REQUIRED_FIELDS:
             if field not in data:
                 errors[field] = ['This field is required for creating new orders']
         
         if errors:
-            return JsonResponse({
+            return json_response({
                 'status': 'error',
                 'message': 'Missing required fields for creating new order',
                 'errors': errors
@@ -125,7 +258,7 @@ def create_update_order(request):
             if not opened_at:
                 raise ValueError("Invalid datetime format")
         except (ValueError, TypeError):
-            return JsonResponse({
+            return json_response({
                 'status': 'error',
                 'message': 'Invalid opened_at datetime format. Use ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ'
             }, status=400)
@@ -135,56 +268,37 @@ def create_update_order(request):
         try:
             closed_at = parse_datetime(data['closed_at'])
         except (ValueError, TypeError):
-            return JsonResponse({
+            return json_response({
                 'status': 'error',
                 'message': 'Invalid closed_at datetime format. Use ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ'
             }, status=400)
     
     # Convert decimal fields (only if provided)
-    decimal_fields = {}
     try:
-        if data.get('entry_price'):
-            decimal_fields['entry_price'] = Decimal(str(data['entry_price']))
-        if data.get('lot_size'):
-            decimal_fields['lot_size'] = Decimal(str(data['lot_size']))
-        if data.get('profit_loss') is not None:
-            decimal_fields['profit_loss'] = Decimal(str(data['profit_loss']))
-        if data.get('commission') is not None:
-            decimal_fields['commission'] = Decimal(str(data['commission']))
-        if data.get('swap_fee') is not None:
-            decimal_fields['swap_fee'] = Decimal(str(data['swap_fee']))
-        if data.get('exit_price'):
-            decimal_fields['exit_price'] = Decimal(str(data['exit_price']))
-        if data.get('take_profit'):
-            decimal_fields['take_profit'] = Decimal(str(data['take_profit']))
-        if data.get('stop_loss'):
-            decimal_fields['stop_loss'] = Decimal(str(data['stop_loss']))
-        if data.get('account_balance_at_close'):
-            decimal_fields['account_balance_at_close'] = Decimal(str(data['account_balance_at_close']))
-            
+        decimal_fields = parse_order_decimals(data)
     except (ValueError, InvalidOperation):
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Invalid decimal format in price/amount fields'
         }, status=400)
     
     # Validate position type if provided
-    if data.get('position_type') and data['position_type'] not in ['BUY', 'SELL']:
-        return JsonResponse({
+    if data.get('position_type') and data['position_type'] not in VALID_POSITION_TYPES:
+        return json_response({
             'status': 'error',
             'message': 'Invalid position_type. Must be BUY or SELL'
         }, status=400)
     
     # Validate position status if provided
-    if data.get('position_status') and data['position_status'] not in ['OPEN', 'CLOSED', 'PENDING']:
-        return JsonResponse({
+    if data.get('position_status') and data['position_status'] not in VALID_POSITION_STATUSES:
+        return json_response({
             'status': 'error',
             'message': 'Invalid position_status. Must be OPEN, CLOSED, or PENDING'
         }, status=400)
     
     # Validate close_reason if provided
-    if data.get('close_reason') and data['close_reason'] not in ['MANUAL', 'TP', 'SL', 'MARGIN_CALL']:
-        return JsonResponse({
+    if data.get('close_reason') and data['close_reason'] not in VALID_CLOSE_REASONS:
+        return json_response({
             'status': 'error',
             'message': 'Invalid close_reason. Must be MANUAL, TP, SL, or MARGIN_CALL'
         }, status=400)
@@ -241,26 +355,25 @@ def create_update_order(request):
             exit_price=decimal_fields.get('exit_price'),
             take_profit=decimal_fields.get('take_profit'),
             stop_loss=decimal_fields.get('stop_loss'),
-            profit_loss=decimal_fields.get('profit_loss', Decimal('0.0000')),
-            commission=decimal_fields.get('commission', Decimal('0.0000')),
-            swap_fee=decimal_fields.get('swap_fee', Decimal('0.0000')),
+            profit_loss=decimal_fields.get('profit_loss', ZERO_AMOUNT),
+            commission=decimal_fields.get('commission', ZERO_AMOUNT),
+            swap_fee=decimal_fields.get('swap_fee', ZERO_AMOUNT),
             account_balance_at_close=decimal_fields.get('account_balance_at_close'),
             comment=data.get('comment')
         )
         created = True
     
-    # Update account balance if provided
-    if data.get('current_balance'):
+    # Update last sync time, and account balance if provided
+    account_updates = {'last_sync_datetime': timezone.now()}
+    if data.get('current_balance') is not None:
         try:
-            trade_account.current_balance = Decimal(str(data['current_balance']))
+            account_updates['current_balance'] = _to_decimal(data['current_balance'])
         except (ValueError, InvalidOperation):
             pass
     
-    # Update last sync time
-    trade_account.last_sync_datetime = timezone.now()
-    trade_account.save(update_fields=['last_sync_datetime', 'current_balance'])
+    UserTradeAccount.objects.filter(pk=trade_account.pk).update(**account_updates)
     
-    return JsonResponse({
+    return json_response({
         'status': 'success',
         'message': 'Order created successfully' if created else 'Order updated successfully',
         'order_id': data['mt5_order_id'],
@@ -292,39 +405,44 @@ def batch_create_update_orders(request):
     ]
     """
     try:
-        orders_data = json.loads(request.body)
-    except json.JSONDecodeError:
-        return JsonResponse({
+        orders_data = orjson.loads(request.body)
+    except orjson.JSONDecodeError:
+        return json_response({
             'status': 'error',
             'message': 'Invalid JSON data'
         }, status=400)
     
     # Validate that it's an array
     if not isinstance(orders_data, list):
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Request body must be an array of orders'
         }, status=400)
     
     if len(orders_data) == 0:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Orders array cannot be empty'
         }, status=400)
     
     # Limit batch size to prevent timeout
     if len(orders_data) > 500:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Batch size limit exceeded. Maximum 500 orders per request.'
         }, status=400)
     
     # Process orders
     results = {
-        'created': [],
-        'updated': [],
+        'created': 0,
+        'updated': 0,
         'failed': []
     }
+    orders_to_create = []
+    orders_to_update = {}
+    accounts_to_update = {}
+    strategy_cache = {}
+    now = timezone.now()
     
     # Pre-fetch all accounts and existing orders to minimize DB queries
     account_ids = list(set(str(order.get('mt5_account_id')) for order in orders_data if order.get('mt5_account_id')))
@@ -344,20 +462,26 @@ def batch_create_update_orders(request):
         if acc_id in accounts_cache:
             if acc_id not in order_ids_by_account:
                 order_ids_by_account[acc_id] = []
-            if 'mt5_order_id' in order_data:
-                order_ids_by_account[acc_id].append(order_data['mt5_order_id'])
+            order_id = parse_order_id(order_data.get('mt5_order_id'))
+            if order_id is not None:
+                order_ids_by_account[acc_id].append(order_id)
     
+    # One query for the existing orders of every account in the batch,
+    # served by the (mt5_order_id, trade_account) index
     existing_orders_cache = {}
+    existing_filter = Q()
     for acc_id, order_ids in order_ids_by_account.items():
         if order_ids:
-            account = accounts_cache[acc_id]
-            existing = TradeTransaction.objects.filter(
-                trade_account=account,
-                mt5_order_id__in=order_ids
-            )
-            for order in existing:
-                key = f"{acc_id}_{order.mt5_order_id}"
-                existing_orders_cache[key] = order
+            existing_filter |= Q(trade_account_id=accounts_cache[acc_id].pk, mt5_order_id__in=order_ids)
+    
+    if existing_filter:
+        mt5_account_ids = {account.pk: acc_id for acc_id, account in accounts_cache.items()}
+        existing = TradeTransaction.objects.filter(existing_filter).only(
+            'id', 'trade_account_id', 'mt5_order_id', *BATCH_ORDER_UPDATE_FIELDS
+        )
+        for order in existing:
+            key = f"{mt5_account_ids[order.trade_account_id]}_{order.mt5_order_id}"
+            existing_orders_cache[key] = order
     
     for idx, order_data in enumerate(orders_data):
         try:
@@ -379,7 +503,15 @@ def batch_create_update_orders(request):
                 continue
             
             mt5_account_id = str(order_data['mt5_account_id'])
-            mt5_order_id = order_data['mt5_order_id']
+            mt5_order_id = parse_order_id(order_data['mt5_order_id'])
+            
+            if mt5_order_id is None:
+                results['failed'].append({
+                    'index': idx,
+                    'order_id': order_data['mt5_order_id'],
+                    'error': 'mt5_order_id must be a whole number'
+                })
+                continue
             
             # Get trade account from cache
             if mt5_account_id not in accounts_cache:
@@ -399,8 +531,7 @@ def batch_create_update_orders(request):
             
             if not is_update:
                 # Validate required fields for new orders
-                required_fields = ['symbol', 'position_type', 'opened_at', 'entry_price', 'lot_size']
-                missing_fields = [f for f in required_fields if f not in order_data]
+                missing_fields = [f for f in ORDER_CREATE_REQUIRED_FIELDS if f not in order_data]
                 
                 if missing_fields:
                     results['failed'].append({
@@ -438,26 +569,8 @@ def batch_create_update_orders(request):
                     continue
             
             # Convert decimal fields
-            decimal_fields = {}
             try:
-                if order_data.get('entry_price'):
-                    decimal_fields['entry_price'] = Decimal(str(order_data['entry_price']))
-                if order_data.get('lot_size'):
-                    decimal_fields['lot_size'] = Decimal(str(order_data['lot_size']))
-                if order_data.get('profit_loss') is not None:
-                    decimal_fields['profit_loss'] = Decimal(str(order_data['profit_loss']))
-                if order_data.get('commission') is not None:
-                    decimal_fields['commission'] = Decimal(str(order_data['commission']))
-                if order_data.get('swap_fee') is not None:
-                    decimal_fields['swap_fee'] = Decimal(str(order_data['swap_fee']))
-                if order_data.get('exit_price'):
-                    decimal_fields['exit_price'] = Decimal(str(order_data['exit_price']))
-                if order_data.get('take_profit'):
-                    decimal_fields['take_profit'] = Decimal(str(order_data['take_profit']))
-                if order_data.get('stop_loss'):
-                    decimal_fields['stop_loss'] = Decimal(str(order_data['stop_loss']))
-                if order_data.get('account_balance_at_close'):
-                    decimal_fields['account_balance_at_close'] = Decimal(str(order_data['account_balance_at_close']))
+                decimal_fields = parse_order_decimals(order_data)
             except (ValueError, InvalidOperation):
                 results['failed'].append({
                     'index': idx,
@@ -467,7 +580,7 @@ def batch_create_update_orders(request):
                 continue
             
             # Validate enums
-            if order_data.get('position_type') and order_data['position_type'] not in ['BUY', 'SELL']:
+            if order_data.get('position_type') and order_data['position_type'] not in VALID_POSITION_TYPES:
                 results['failed'].append({
                     'index': idx,
                     'order_id': mt5_order_id,
@@ -475,7 +588,7 @@ def batch_create_update_orders(request):
                 })
                 continue
             
-            if order_data.get('position_status') and order_data['position_status'] not in ['OPEN', 'CLOSED', 'PENDING']:
+            if order_data.get('position_status') and order_data['position_status'] not in VALID_POSITION_STATUSES:
                 results['failed'].append({
                     'index': idx,
                     'order_id': mt5_order_id,
@@ -483,7 +596,7 @@ def batch_create_update_orders(request):
                 })
                 continue
             
-            if order_data.get('close_reason') and order_data['close_reason'] not in ['MANUAL', 'TP', 'SL', 'MARGIN_CALL', 'Mobile', 'Web', 'Expert']:
+            if order_data.get('close_reason') and order_data['close_reason'] not in VALID_BATCH_CLOSE_REASONS:
                 results['failed'].append({
                     'index': idx,
                     'order_id': mt5_order_id,
@@ -491,63 +604,78 @@ def batch_create_update_orders(request):
                 })
                 continue
             
-            # Create or update within transaction
-            with transaction.atomic():
-                if is_update:
-                    # Update existing transaction
-                    trans = existing_transaction
-                    
-                    if order_data.get('position_status'):
-                        trans.position_status = order_data['position_status']
-                    if closed_at is not None:
-                        trans.closed_at = closed_at
-                    if order_data.get('close_reason'):
-                        trans.close_reason = order_data['close_reason']
-                    if order_data.get('comment'):
-                        trans.comment = order_data['comment']
-                    
-                    # Update decimal fields if provided
-                    for field, value in decimal_fields.items():
-                        setattr(trans, field, value)
-                    
-                    trans.save()
-                    results['updated'].append(mt5_order_id)
-                else:
-                    # Get bot strategy from comment field
-                    bot_strategy = get_bot_strategy_from_comment(order_data.get('comment'), trade_account)
-                    
-                    # Create new transaction
-                    TradeTransaction.objects.create(
-                        trade_account=trade_account,
-                        bot_strategy=bot_strategy,
-                        mt5_order_id=mt5_order_id,
-                        symbol=order_data['symbol'],
-                        position_type=order_data['position_type'],
-                        position_status=order_data.get('position_status', 'OPEN'),
-                        opened_at=opened_at,
-                        closed_at=closed_at,
-                        close_reason=order_data.get('close_reason'),
-                        entry_price=decimal_fields['entry_price'],
-                        lot_size=decimal_fields['lot_size'],
-                        exit_price=decimal_fields.get('exit_price'),
-                        take_profit=decimal_fields.get('take_profit'),
-                        stop_loss=decimal_fields.get('stop_loss'),
-                        profit_loss=decimal_fields.get('profit_loss', Decimal('0.0000')),
-                        commission=decimal_fields.get('commission', Decimal('0.0000')),
-                        swap_fee=decimal_fields.get('swap_fee', Decimal('0.0000')),
-                        account_balance_at_close=decimal_fields.get('account_balance_at_close'),
-                        comment=order_data.get('comment')
-                    )
-                    results['created'].append(mt5_order_id)
+            # Values the database would reject must fail here, not in the bulk write below
+            limit_error = order_limit_error(order_data, decimal_fields)
+            if limit_error:
+                results['failed'].append({
+                    'index': idx,
+                    'order_id': mt5_order_id,
+                    'error': limit_error
+                })
+                continue
+            
+            # Stage the create or update; everything is written in bulk below
+            if is_update:
+                trans = existing_transaction
+                
+                if order_data.get('position_status'):
+                    trans.position_status = order_data['position_status']
+                if closed_at is not None:
+                    trans.closed_at = closed_at
+                if order_data.get('close_reason'):
+                    trans.close_reason = order_data['close_reason']
+                if order_data.get('comment'):
+                    trans.comment = order_data['comment']
+                
+                # Update decimal fields if provided
+                for field, value in decimal_fields.items():
+                    setattr(trans, field, value)
                 
-                # Update account balance if provided in this order
-                if order_data.get('current_balance'):
-                    try:
-                        trade_account.current_balance = Decimal(str(order_data['current_balance']))
-                        trade_account.last_sync_datetime = timezone.now()
-                        trade_account.save(update_fields=['last_sync_datetime', 'current_balance'])
-                    except (ValueError, InvalidOperation):
-                        pass
+                # Orders created earlier in this batch are still pending insert
+                if trans.pk is not None:
+                    trans.updated_at = now
+                    orders_to_update[cache_key] = trans
+                results['updated'] += 1
+            else:
+                # Get bot strategy from comment field
+                bot_strategy = get_bot_strategy_from_comment(order_data.get('comment'), trade_account, strategy_cache)
+                
+                trans = TradeTransaction(
+                    trade_account=trade_account,
+                    bot_strategy=bot_strategy,
+                    mt5_order_id=mt5_order_id,
+                    symbol=order_data['symbol'],
+                    position_type=order_data['position_type'],
+                    position_status=order_data.get('position_status', 'OPEN'),
+                    opened_at=opened_at,
+                    closed_at=closed_at,
+                    close_reason=order_data.get('close_reason'),
+                    entry_price=decimal_fields['entry_price'],
+                    lot_size=decimal_fields['lot_size'],
+                    exit_price=decimal_fields.get('exit_price'),
+                    take_profit=decimal_fields.get('take_profit'),
+                    stop_loss=decimal_fields.get('stop_loss'),
+                    profit_loss=decimal_fields.get('profit_loss', ZERO_AMOUNT),
+                    commission=decimal_fields.get('commission', ZERO_AMOUNT),
+                    swap_fee=decimal_fields.get('swap_fee', ZERO_AMOUNT),
+                    account_balance_at_close=decimal_fields.get('account_balance_at_close'),
+                    comment=order_data.get('comment')
+                )
+                orders_to_create.append(trans)
+                # Later duplicates of this order in the batch update the pending instance
+                existing_orders_cache[cache_key] = trans
+                results['created'] += 1
+            
+            # Remember the latest account balance provided in this batch
+            if order_data.get('current_balance') is not None:
+                try:
+                    balance = _to_decimal(order_data['current_balance'])
+                except (ValueError, InvalidOperation):
+                    balance = None
+                if balance is not None and decimal_fits(balance, UserTradeAccount._meta.get_field('current_balance')):
+                    trade_account.current_balance = balance
+                    trade_account.last_sync_datetime = now
+                    accounts_to_update[trade_account.pk] = trade_account
                     
         except Exception as e:
             results['failed'].append({
@@ -556,13 +684,32 @@ def batch_create_update_orders(request):
                 'error': str(e)
             })
     
+    try:
+        with transaction.atomic():
+            TradeTransaction.objects.bulk_create(orders_to_create, batch_size=500)
+            TradeTransaction.objects.bulk_update(
+                list(orders_to_update.values()),
+                BATCH_ORDER_UPDATE_FIELDS,
+                batch_size=500
+            )
+            UserTradeAccount.objects.bulk_update(
+                list(accounts_to_update.values()),
+                ['current_balance', 'last_sync_datetime']
+            )
+    except Exception:
+        logger.exception('Failed to write order batch')
+        return json_response({
+            'status': 'error',
+            'message': 'Failed to save orders. No orders in this batch were written.'
+        }, status=500)
+    
     # Limit response size - only return failed order details
     response_data = {
         'status': 'success',
         'message': f"Processed {len(orders_data)} orders",
         'results': {
-            'created': len(results['created']),
-            'updated': len(results['updated']),
+            'created': results['created'],
+            'updated': results['updated'],
             'failed': len(results['failed'])
         }
     }
@@ -574,7 +721,7 @@ def batch_create_update_orders(request):
         response_data['results']['failed_count'] = len(results['failed'])
         response_data['results']['note'] = 'Too many failures to list. Check server logs.'
     
-    return JsonResponse(response_data, status=200)
+    return json_response(response_data, status=200)
 
 
 @require_http_methods(["GET"])
@@ -590,7 +737,7 @@ def get_account_config(request, mt5_account_id):
             is_active=True
         )
     except UserTradeAccount.DoesNotExist:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': f"Trade account {mt5_account_id} not found"
         }, status=404)
@@ -601,7 +748,7 @@ def get_account_config(request, mt5_account_id):
         delta = trade_account.subscription_expiry - timezone.now()
         days_remaining = max(0, delta.days)
     
-    return JsonResponse({
+    return json_response({
         'status': 'success',
         'data': {
             'account_id': trade_account.mt5_account_id,
@@ -630,16 +777,16 @@ def bot_heartbeat(request):
     so bot can update its settings without making additional API calls.
     """
     try:
-        data = json.loads(request.body)
-    except json.JSONDecodeError:
-        return JsonResponse({
+        data = orjson.loads(request.body)
+    except orjson.JSONDecodeError:
+        return json_response({
             'status': 'error',
             'message': 'Invalid JSON data'
         }, status=400)
     
     # Validate required fields
     if 'mt5_account_id' not in data:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'mt5_account_id is required'
         }, status=400)
@@ -651,17 +798,23 @@ def bot_heartbeat(request):
             is_active=True
         )
     except UserTradeAccount.DoesNotExist:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': f"Trade account {data['mt5_account_id']} not found"
         }, status=404)
     
+    now = timezone.now()
+    
+    # Only fields the bot actually sent are written back
+    update_fields = ['last_sync_datetime']
+    
     # Update bot status if provided
     if 'bot_status' in data and data['bot_status'] is not None:
-        if data['bot_status'] in ['ACTIVE', 'PAUSED', 'DOWN']:
+        if data['bot_status'] in VALID_BOT_STATUSES:
             trade_account.bot_status = data['bot_status']
+            update_fields.append('bot_status')
         else:
-            return JsonResponse({
+            return json_response({
                 'status': 'error',
                 'message': 'Invalid bot_status. Must be ACTIVE, PAUSED, or DOWN'
             }, status=400)
@@ -669,22 +822,22 @@ def bot_heartbeat(request):
     # Update balance if provided
     if 'current_balance' in data:
         try:
-            new_balance = Decimal(str(data['current_balance']))
+            new_balance = _to_decimal(data['current_balance'])
             trade_account.current_balance = new_balance
+            update_fields.append('current_balance')
             
             # Update peak balance if current balance exceeds it
             if new_balance > trade_account.peak_balance:
                 trade_account.peak_balance = new_balance
+                update_fields.append('peak_balance')
                 
         except (ValueError, InvalidOperation):
-            return JsonResponse({
+            return json_response({
                 'status': 'error',
                 'message': 'Invalid current_balance format'
             }, status=400)
     
     # Update DD block status if provided
-    update_fields = ['bot_status', 'current_balance', 'peak_balance', 'last_sync_datetime']
-    
     if 'dd_blocked' in data:
         dd_blocked = data['dd_blocked']
         if isinstance(dd_blocked, bool):
@@ -694,9 +847,9 @@ def bot_heartbeat(request):
             # If blocked, update reason and timestamp
             if dd_blocked and 'dd_block_reason' in data:
                 dd_reason = data['dd_block_reason']
-                if dd_reason in ['DAILY_DD_LIMIT', 'MAX_ACCOUNT_DD']:
+                if dd_reason in VALID_DD_BLOCK_REASONS:
                     trade_account.dd_block_reason = dd_reason
-                    trade_account.dd_blocked_at = timezone.now()
+                    trade_account.dd_blocked_at = now
                     update_fields.extend(['dd_block_reason', 'dd_blocked_at'])
             # If unblocked, clear reason and timestamp
             elif not dd_blocked:
@@ -705,14 +858,16 @@ def bot_heartbeat(request):
                 update_fields.extend(['dd_block_reason', 'dd_blocked_at'])
     
     # Update last sync time
-    trade_account.last_sync_datetime = timezone.now()
-    trade_account.save(update_fields=update_fields)
+    trade_account.last_sync_datetime = now
+    UserTradeAccount.objects.filter(pk=trade_account.pk).update(
+        **{field: getattr(trade_account, field) for field in update_fields}
+    )
     
     # Check if bot should continue (subscription active)
     should_continue = (
         trade_account.subscription_status == 'ACTIVE' and 
         trade_account.subscription_expiry and
-        trade_account.subscription_expiry > timezone.now()
+        trade_account.subscription_expiry > now
     )
     
     # Get trade config and strategy parameters
@@ -762,14 +917,14 @@ def bot_heartbeat(request):
             'parameters_by_symbol': current_parameters,
         }
     
-    return JsonResponse({
+    return json_response({
         'status': 'success',
         'message': 'Heartbeat received',
-        'server_time': timezone.now().isoformat(),
+        'server_time': now.isoformat(),
         'should_continue': should_continue,
         'bot_status': trade_account.bot_status,
         'subscription_status': trade_account.subscription_status,
-        'days_remaining': (trade_account.subscription_expiry - timezone.now()).days if trade_account.subscription_expiry else 0,
+        'days_remaining': (trade_account.subscription_expiry - now).days if trade_account.subscription_expiry else 0,
         'current_balance': str(trade_account.current_balance),
         'peak_balance': str(trade_account.peak_balance),
         'dd_blocked': trade_account.dd_blocked,
@@ -796,7 +951,7 @@ def get_account_live_data(request, account_id):
             is_active=True
         )
     except UserTradeAccount.DoesNotExist:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Account not found'
         }, status=404)
@@ -806,77 +961,83 @@ def get_account_live_data(request, account_id):
         trade_account=account,
         position_status='OPEN',
         is_active=True
-    ).order_by('-opened_at')
+    ).order_by('-opened_at').values(
+        'id', 'mt5_order_id', 'symbol', 'position_type', 'entry_price',
+        'lot_size', 'take_profit', 'stop_loss', 'profit_loss', 'opened_at'
+    )
     
     # Get recent closed positions (last 10)
     closed_positions = TradeTransaction.objects.filter(
         trade_account=account,
         position_status='CLOSED',
         is_active=True
-    ).order_by('-closed_at')[:10]
+    ).order_by('-closed_at').values(
+        'id', 'mt5_order_id', 'symbol', 'position_type', 'close_reason',
+        'entry_price', 'lot_size', 'profit_loss', 'closed_at'
+    )[:10]
     
-    # Calculate stats
-    all_closed = TradeTransaction.objects.filter(
+    # Calculate stats using aggregation
+    closed_stats = TradeTransaction.objects.filter(
         trade_account=account,
         position_status='CLOSED',
         is_active=True
+    ).aggregate(
+        total_trades=Count('id'),
+        closed_pnl=Sum('profit_loss'),
+        winning_trades=Count('id', filter=Q(profit_loss__gt=0))
     )
     
-    total_trades = all_closed.count()
-    closed_pnl = sum(t.profit_loss for t in all_closed)
-    winning_trades = all_closed.filter(profit_loss__gt=0).count()
+    total_trades = closed_stats['total_trades'] or 0
+    closed_pnl = closed_stats['closed_pnl'] or ZERO_AMOUNT
+    winning_trades = closed_stats['winning_trades'] or 0
     win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
     
     # Calculate current P&L from open positions
-    current_open_pnl = sum(pos.profit_loss for pos in open_positions)
+    current_open_pnl = sum(pos['profit_loss'] for pos in open_positions)
     
     # Total P&L = Closed P&L + Current Open P&L
     total_pnl = closed_pnl + current_open_pnl
     
     # Format open positions
-    open_positions_data = []
-    for pos in open_positions:
-        open_positions_data.append({
-            'id': pos.id,
-            'mt5_order_id': pos.mt5_order_id,
-            'symbol': pos.symbol,
-            'position_type': pos.position_type,
-            'position_type_display': pos.get_position_type_display(),
-            'entry_price': str(pos.entry_price),
-            'lot_size': str(pos.lot_size),
-            'take_profit': str(pos.take_profit) if pos.take_profit else None,
-            'stop_loss': str(pos.stop_loss) if pos.stop_loss else None,
-            'profit_loss': float(pos.profit_loss),
-            'opened_at': pos.opened_at.strftime('%d %b %y %H:%M'),
-        })
+    open_positions_data = [{
+        'id': pos['id'],
+        'mt5_order_id': pos['mt5_order_id'],
+        'symbol': pos['symbol'],
+        'position_type': pos['position_type'],
+        'position_type_display': POSITION_TYPE_LABELS.get(pos['position_type'], pos['position_type']),
+        'entry_price': str(pos['entry_price']),
+        'lot_size': str(pos['lot_size']),
+        'take_profit': str(pos['take_profit']) if pos['take_profit'] else None,
+        'stop_loss': str(pos['stop_loss']) if pos['stop_loss'] else None,
+        'profit_loss': float(pos['profit_loss']),
+        'opened_at': pos['opened_at'].strftime('%d %b %y %H:%M'),
+    } for pos in open_positions]
     
     # Format closed positions
-    closed_positions_data = []
-    for pos in closed_positions:
-        closed_positions_data.append({
-            'id': pos.id,
-            'mt5_order_id': pos.mt5_order_id,
-            'symbol': pos.symbol,
-            'position_type': pos.position_type,
-            'position_type_display': pos.get_position_type_display(),
-            'close_reason': pos.close_reason,
-            'close_reason_display': pos.get_close_reason_display() if pos.close_reason else None,
-            'entry_price': str(pos.entry_price),
-            'lot_size': str(pos.lot_size),
-            'profit_loss': float(pos.profit_loss),
-            'closed_at': pos.closed_at.strftime('%d %b %y %H:%M') if pos.closed_at else None,
-        })
+    closed_positions_data = [{
+        'id': pos['id'],
+        'mt5_order_id': pos['mt5_order_id'],
+        'symbol': pos['symbol'],
+        'position_type': pos['position_type'],
+        'position_type_display': POSITION_TYPE_LABELS.get(pos['position_type'], pos['position_type']),
+        'close_reason': pos['close_reason'],
+        'close_reason_display': CLOSE_REASON_LABELS.get(pos['close_reason'], pos['close_reason']) if pos['close_reason'] else None,
+        'entry_price': str(pos['entry_price']),
+        'lot_size': str(pos['lot_size']),
+        'profit_loss': float(pos['profit_loss']),
+        'closed_at': pos['closed_at'].strftime('%d %b %y %H:%M') if pos['closed_at'] else None,
+    } for pos in closed_positions]
     
-    return JsonResponse({
+    return json_response({
         'status': 'success',
         'data': {
             'account': {
                 'balance': float(account.current_balance),
                 'bot_status': account.bot_status,
-                'bot_status_display': account.get_bot_status_display(),
+                'bot_status_display': BOT_STATUS_LABELS.get(account.bot_status, account.bot_status),
                 'dd_blocked': account.dd_blocked,
                 'dd_block_reason': account.dd_block_reason,
-                'dd_block_reason_display': account.get_dd_block_reason_display() if account.dd_block_reason else None,
+                'dd_block_reason_display': DD_BLOCK_REASON_LABELS.get(account.dd_block_reason, account.dd_block_reason) if account.dd_block_reason else None,
                 'dd_blocked_at': account.dd_blocked_at.isoformat() if account.dd_blocked_at else None,
             },
             'stats': {
@@ -898,33 +1059,36 @@ def get_dashboard_live_data(request):
     Get real-time dashboard data for all user accounts.
     Returns summary data for each trading account.
     """
+    now = timezone.now()
+
     # Get all active accounts for user
     accounts = UserTradeAccount.objects.filter(
         user=request.user,
         is_active=True
     ).order_by('-created_at')
     
+    # Open and closed position stats for every account in one grouped query
+    trade_stats = {
+        row['trade_account_id']: row
+        for row in TradeTransaction.objects.filter(
+            trade_account__in=accounts,
+            position_status__in=['OPEN', 'CLOSED'],
+            is_active=True
+        ).values('trade_account_id').annotate(
+            open_count=Count('id', filter=Q(position_status='OPEN')),
+            current_pnl=Sum('profit_loss', filter=Q(position_status='OPEN')),
+            total_trades=Count('id', filter=Q(position_status='CLOSED')),
+            closed_pnl=Sum('profit_loss', filter=Q(position_status='CLOSED'))
+        ).order_by()
+    }
+    
     accounts_data = []
     for account in accounts:
-        # Get open positions count and current P&L
-        open_positions = TradeTransaction.objects.filter(
-            trade_account=account,
-            position_status='OPEN',
-            is_active=True
-        )
-        
-        open_count = open_positions.count()
-        current_pnl = sum(pos.profit_loss for pos in open_positions)
-        
-        # Get total stats
-        all_closed = TradeTransaction.objects.filter(
-            trade_account=account,
-            position_status='CLOSED',
-            is_active=True
-        )
-        
-        total_trades = all_closed.count()
-        closed_pnl = sum(t.profit_loss for t in all_closed)
+        stats = trade_stats.get(account.id, {})
+        open_count = stats.get('open_count') or 0
+        current_pnl = stats.get('current_pnl') or ZERO_AMOUNT
+        total_trades = stats.get('total_trades') or 0
+        closed_pnl = stats.get('closed_pnl') or ZERO_AMOUNT
         
         # Total P&L = Closed P&L + Current Open P&L
         total_pnl = closed_pnl + current_pnl
@@ -932,7 +1096,7 @@ def get_dashboard_live_data(request):
         # Calculate days until expiry
         days_until_expiry = 0
         if account.subscription_expiry:
-            delta = account.subscription_expiry - timezone.now()
+            delta = account.subscription_expiry - now
             days_until_expiry = max(0, delta.days)
         
         accounts_data.append({
@@ -941,10 +1105,10 @@ def get_dashboard_live_data(request):
             'broker_name': account.broker_name,
             'balance': float(account.current_balance),
             'bot_status': account.bot_status,
-            'bot_status_display': account.get_bot_status_display(),
+            'bot_status_display': BOT_STATUS_LABELS.get(account.bot_status, account.bot_status),
             'dd_blocked': account.dd_blocked,
             'dd_block_reason': account.dd_block_reason,
-            'dd_block_reason_display': account.get_dd_block_reason_display() if account.dd_block_reason else None,
+            'dd_block_reason_display': DD_BLOCK_REASON_LABELS.get(account.dd_block_reason, account.dd_block_reason) if account.dd_block_reason else None,
             'dd_blocked_at': account.dd_blocked_at.isoformat() if account.dd_blocked_at else None,
             'open_positions_count': open_count,
             'current_pnl': float(current_pnl),
@@ -953,12 +1117,12 @@ def get_dashboard_live_data(request):
             'days_until_expiry': days_until_expiry,
         })
     
-    return JsonResponse({
+    return json_response({
         'status': 'success',
         'data': {
             'accounts': accounts_data,
         },
-        'timestamp': timezone.now().isoformat()
+        'timestamp': now.isoformat()
     })
 
 
@@ -977,7 +1141,7 @@ def get_account_open_positions_only(request, account_id):
             is_active=True
         )
     except UserTradeAccount.DoesNotExist:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Account not found'
         }, status=404)
@@ -1001,8 +1165,8 @@ def get_account_open_positions_only(request, account_id):
         closed_pnl=Sum('profit_loss')
     )
     
-    current_open_pnl = open_stats['current_open_pnl'] or Decimal('0')
-    closed_pnl = closed_stats['closed_pnl'] or Decimal('0')
+    current_open_pnl = open_stats['current_open_pnl'] or ZERO_AMOUNT
+    closed_pnl = closed_stats['closed_pnl'] or ZERO_AMOUNT
     total_pnl = closed_pnl + current_open_pnl
     
     # Get open positions with only essential fields
@@ -1010,21 +1174,21 @@ def get_account_open_positions_only(request, account_id):
         trade_account=account,
         position_status='OPEN',
         is_active=True
-    ).only(
+    ).order_by('-opened_at').values(
         'id', 'mt5_order_id', 'symbol', 'position_type',
         'profit_loss', 'updated_at'
-    ).order_by('-opened_at')[:100]  # Limit to 100 most recent
+    )[:100]  # Limit to 100 most recent
     
     positions_data = [{
-        'id': pos.id,
-        'mt5_order_id': pos.mt5_order_id,
-        'symbol': pos.symbol,
-        'position_type': pos.position_type,
-        'profit_loss': float(pos.profit_loss),
-        'updated_at': pos.updated_at.isoformat(),
+        'id': pos['id'],
+        'mt5_order_id': pos['mt5_order_id'],
+        'symbol': pos['symbol'],
+        'position_type': pos['position_type'],
+        'profit_loss': float(pos['profit_loss']),
+        'updated_at': pos['updated_at'].isoformat(),
     } for pos in open_positions]
     
-    return JsonResponse({
+    return json_response({
         'status': 'success',
         'data': {
             'balance': float(account.current_balance),
@@ -1051,7 +1215,7 @@ def get_account_closed_positions(request, account_id):
             is_active=True
         )
     except UserTradeAccount.DoesNotExist:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Account not found'
         }, status=404)
@@ -1065,16 +1229,12 @@ def get_account_closed_positions(request, account_id):
         trade_account=account,
         position_status='CLOSED',
         is_active=True
-    ).order_by('-closed_at')[offset:offset+limit]
-    
-    # Get total count
-    total_count = TradeTransaction.objects.filter(
-        trade_account=account,
-        position_status='CLOSED',
-        is_active=True
-    ).count()
+    ).order_by('-closed_at').values(
+        'id', 'mt5_order_id', 'symbol', 'position_type', 'close_reason',
+        'entry_price', 'lot_size', 'profit_loss', 'closed_at'
+    )[offset:offset+limit]
     
-    # Get closed stats using aggregation
+    # Get closed stats (and the pagination total) using aggregation
     closed_stats = TradeTransaction.objects.filter(
         trade_account=account,
         position_status='CLOSED',
@@ -1086,25 +1246,25 @@ def get_account_closed_positions(request, account_id):
     )
     
     total_trades = closed_stats['total_trades'] or 0
-    closed_pnl = closed_stats['closed_pnl'] or Decimal('0')
+    closed_pnl = closed_stats['closed_pnl'] or ZERO_AMOUNT
     winning_trades = closed_stats['winning_trades'] or 0
     win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
     
     positions_data = [{
-        'id': pos.id,
-        'mt5_order_id': pos.mt5_order_id,
-        'symbol': pos.symbol,
-        'position_type': pos.position_type,
-        'position_type_display': pos.get_position_type_display(),
-        'close_reason': pos.close_reason,
-        'close_reason_display': pos.get_close_reason_display() if pos.close_reason else None,
-        'entry_price': str(pos.entry_price),
-        'lot_size': str(pos.lot_size),
-        'profit_loss': float(pos.profit_loss),
-        'closed_at': pos.closed_at.strftime('%d %b %y %H:%M') if pos.closed_at else None,
+        'id': pos['id'],
+        'mt5_order_id': pos['mt5_order_id'],
+        'symbol': pos['symbol'],
+        'position_type': pos['position_type'],
+        'position_type_display': POSITION_TYPE_LABELS.get(pos['position_type'], pos['position_type']),
+        'close_reason': pos['close_reason'],
+        'close_reason_display': CLOSE_REASON_LABELS.get(pos['close_reason'], pos['close_reason']) if pos['close_reason'] else None,
+        'entry_price': str(pos['entry_price']),
+        'lot_size': str(pos['lot_size']),
+        'profit_loss': float(pos['profit_loss']),
+        'closed_at': pos['closed_at'].strftime('%d %b %y %H:%M') if pos['closed_at'] else None,
     } for pos in closed_positions]
     
-    return JsonResponse({
+    return json_response({
         'status': 'success',
         'data': {
             'stats': {
@@ -1114,7 +1274,7 @@ def get_account_closed_positions(request, account_id):
             },
             'closed_positions': positions_data,
             'pagination': {
-                'total': total_count,
+                'total': total_trades,
                 'limit': limit,
                 'offset': offset,
             }
@@ -1156,7 +1316,7 @@ def get_bot_strategies(request):
             'last_optimization_date': bot.last_optimization_date.isoformat() if bot.last_optimization_date else None,
         })
     
-    return JsonResponse({
+    return json_response({
         'status': 'success',
         'data': {
             'strategies': strategies_data,
@@ -1195,12 +1355,12 @@ def submit_backtest_result(request):
             comprehensive_analysis_image = request.FILES.get('comprehensive_analysis_image')
             trading_graph_image = request.FILES.get('trading_graph_image')
         else:
-            data = json.loads(request.body)
+            data = orjson.loads(request.body)
             equity_curve_image = None
             comprehensive_analysis_image = None
             trading_graph_image = None
-    except (json.JSONDecodeError, Exception) as e:
-        return JsonResponse({
+    except (orjson.JSONDecodeError, Exception) as e:
+        return json_response({
             'status': 'error',
             'message': f'Invalid request data: {str(e)}'
         }, status=400)
@@ -1214,7 +1374,7 @@ def submit_backtest_result(request):
             errors[field] = ['This field is required']
     
     if errors:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Missing required fields',
             'errors': errors
@@ -1224,12 +1384,12 @@ def submit_backtest_result(request):
     try:
         bot_strategy = BotStrategy.objects.get(id=data['bot_strategy_id'], is_active=True)
     except BotStrategy.DoesNotExist:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': f"Bot strategy {data['bot_strategy_id']} not found"
         }, status=404)
     except ValueError:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Invalid bot_strategy_id format'
         }, status=400)
@@ -1239,7 +1399,7 @@ def submit_backtest_result(request):
         backtest_start_date = datetime.strptime(data['backtest_start_date'], '%Y-%m-%d').date()
         backtest_end_date = datetime.strptime(data['backtest_end_date'], '%Y-%m-%d').date()
     except (ValueError, TypeError):
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Invalid date format. Use YYYY-MM-DD'
         }, status=400)
@@ -1258,7 +1418,7 @@ def submit_backtest_result(request):
         max_drawdown = Decimal(str(data.get('max_drawdown', '0.0000')))
         max_drawdown_percent = Decimal(str(data.get('max_drawdown_percent', '0.00')))
     except (ValueError, InvalidOperation) as e:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': f'Invalid numeric format: {str(e)}'
         }, status=400)
@@ -1268,9 +1428,9 @@ def submit_backtest_result(request):
     if 'raw_data' in data:
         if isinstance(data['raw_data'], str):
             try:
-                raw_data = json.loads(data['raw_data'])
-            except json.JSONDecodeError:
-                return JsonResponse({
+                raw_data = orjson.loads(data['raw_data'])
+            except orjson.JSONDecodeError:
+                return json_response({
                     'status': 'error',
                     'message': 'Invalid raw_data JSON format'
                 }, status=400)
@@ -1316,7 +1476,7 @@ def submit_backtest_result(request):
         bot_strategy.last_backtest_date = timezone.now()
         bot_strategy.save(update_fields=['last_backtest_date'])
     
-    return JsonResponse({
+    return json_response({
         'status': 'success',
         'message': 'Backtest result submitted successfully',
         'data': {
@@ -1341,22 +1501,22 @@ def submit_optimization_result(request):
     - optimized_parameters (required, JSON object)
     """
     try:
-        data = json.loads(request.body)
-    except json.JSONDecodeError:
-        return JsonResponse({
+        data = orjson.loads(request.body)
+    except orjson.JSONDecodeError:
+        return json_response({
             'status': 'error',
             'message': 'Invalid JSON data'
         }, status=400)
     
     # Validate required fields
     if 'bot_strategy_id' not in data:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'bot_strategy_id is required'
         }, status=400)
     
     if 'optimized_parameters' not in data:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'optimized_parameters is required'
         }, status=400)
@@ -1365,12 +1525,12 @@ def submit_optimization_result(request):
     try:
         bot_strategy = BotStrategy.objects.get(id=data['bot_strategy_id'], is_active=True)
     except BotStrategy.DoesNotExist:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': f"Bot strategy {data['bot_strategy_id']} not found"
         }, status=404)
     except ValueError:
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'Invalid bot_strategy_id format'
         }, status=400)
@@ -1378,7 +1538,7 @@ def submit_optimization_result(request):
     # Validate optimized_parameters is a dict
     optimized_parameters = data['optimized_parameters']
     if not isinstance(optimized_parameters, dict):
-        return JsonResponse({
+        return json_response({
             'status': 'error',
             'message': 'optimized_parameters must be a JSON object'
         }, status=400)
@@ -1388,7 +1548,7 @@ def submit_optimization_result(request):
     bot_strategy.last_optimization_date = timezone.now()
     bot_strategy.save(update_fields=['current_parameters', 'last_optimization_date'])
     
-    return JsonResponse({
+    return json_response({
         'status': 'success',
         'message': 'Optimization result submitted successfully',
         'data': {
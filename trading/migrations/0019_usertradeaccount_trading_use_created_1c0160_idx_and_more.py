@@ -0,0 +1,25 @@
+# Generated by Django 4.2.26 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0018_tradetransaction_comment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usertradeaccount',
+            index=models.Index(fields=['-created_at', '-id'], name='trading_use_created_1c0160_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tradetransaction',
+            index=models.Index(fields=['-opened_at', '-id'], name='trading_tra_opened__d3cb86_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscriptionpayment',
+            index=models.Index(fields=['-payment_date', '-id'], name='trading_sub_payment_1ccb44_idx'),
+        ),
+    ]
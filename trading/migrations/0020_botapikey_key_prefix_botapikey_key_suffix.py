@@ -0,0 +1,32 @@
+# Generated by Django 4.2.26 on 2026-10-16 09:40
+
+from django.db import migrations, models
+
+
+def populate_key_ends(apps, schema_editor):
+    BotAPIKey = apps.get_model('trading', 'BotAPIKey')
+    for api_key in BotAPIKey.objects.only('key'):
+        api_key.key_prefix = api_key.key[:8]
+        api_key.key_suffix = api_key.key[-8:]
+        api_key.save(update_fields=['key_prefix', 'key_suffix'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0019_usertradeaccount_trading_use_created_1c0160_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='botapikey',
+            name='key_prefix',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='First characters of the key, shown and searched in the admin', max_length=8),
+        ),
+        migrations.AddField(
+            model_name='botapikey',
+            name='key_suffix',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Last characters of the key, shown and searched in the admin', max_length=8),
+        ),
+        migrations.RunPython(populate_key_ends, migrations.RunPython.noop),
+    ]
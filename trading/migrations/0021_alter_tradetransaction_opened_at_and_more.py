@@ -0,0 +1,28 @@
+# Generated by Django 4.2.26 on 2026-10-16 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0020_botapikey_key_prefix_botapikey_key_suffix'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tradetransaction',
+            name='opened_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='tradetransaction',
+            name='position_status',
+            field=models.CharField(choices=[('OPEN', 'Open'), ('CLOSED', 'Closed'), ('PENDING', 'Pending')], default='OPEN', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='tradetransaction',
+            name='symbol',
+            field=models.CharField(help_text='Trading symbol (e.g., EURUSD)', max_length=20),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.26 on 2026-10-16 10:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0021_alter_tradetransaction_opened_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usertradeaccount',
+            index=models.Index(fields=['subscription_status', '-subscription_expiry'], name='trading_use_subscri_46f978_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscriptionpayment',
+            index=models.Index(fields=['payment_status', '-payment_date'], name='trading_sub_payment_7bf734_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscriptionpayment',
+            index=models.Index(fields=['user', '-payment_date'], name='trading_sub_user_id_976963_idx'),
+        ),
+    ]
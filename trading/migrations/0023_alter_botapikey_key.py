@@ -0,0 +1,19 @@
+# Generated by Django 4.2.26 on 2026-10-16 11:02
+
+from django.db import migrations, models
+import trading.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0022_usertradeaccount_trading_use_subscri_46f978_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='botapikey',
+            name='key',
+            field=models.CharField(db_index=True, default=trading.models.generate_api_key, editable=False, help_text='Master API key for bot authentication', max_length=64, unique=True),
+        ),
+    ]
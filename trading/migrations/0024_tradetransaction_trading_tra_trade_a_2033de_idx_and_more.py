@@ -0,0 +1,21 @@
+# Generated by Django 4.2.26 on 2026-10-16 12:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0023_alter_botapikey_key'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tradetransaction',
+            index=models.Index(fields=['trade_account', 'position_status', 'is_active', '-opened_at'], name='trading_tra_trade_a_2033de_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tradetransaction',
+            index=models.Index(fields=['trade_account', 'position_status', '-closed_at'], name='trading_tra_trade_a_8dfdb1_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.26 on 2026-10-16 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0024_tradetransaction_trading_tra_trade_a_2033de_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tradetransaction',
+            name='mt5_order_id',
+            field=models.BigIntegerField(help_text='MT5 Order Ticket Number'),
+        ),
+        migrations.AddIndex(
+            model_name='tradetransaction',
+            index=models.Index(fields=['mt5_order_id', 'trade_account'], name='trading_tra_mt5_ord_a34f48_idx'),
+        ),
+    ]
@@ -2,6 +2,8 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
 from decimal import Decimal
+import base64
+import os
 
 
 # Abstract base model for timestamps and soft delete
@@ -246,6 +248,10 @@ class UserTradeAccount(TimeStampedModel):
         verbose_name = 'User Trade Account'
         verbose_name_plural = 'User Trade Accounts'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id']),
+            models.Index(fields=['subscription_status', '-subscription_expiry']),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['user', 'mt5_account_id'],
@@ -274,8 +280,8 @@ class TradeTransaction(TimeStampedModel):
     )
     
     # MT5 order details
-    mt5_order_id = models.BigIntegerField(db_index=True, help_text="MT5 Order Ticket Number")
-    symbol = models.CharField(max_length=20, db_index=True, help_text="Trading symbol (e.g., EURUSD)")
+    mt5_order_id = models.BigIntegerField(help_text="MT5 Order Ticket Number")
+    symbol = models.CharField(max_length=20, help_text="Trading symbol (e.g., EURUSD)")
     
     # Position details
     position_type = models.CharField(
@@ -286,12 +292,11 @@ class TradeTransaction(TimeStampedModel):
     position_status = models.CharField(
         max_length=20,
         choices=PositionStatus.choices,
-        default=PositionStatus.OPEN,
-        db_index=True
+        default=PositionStatus.OPEN
     )
     
     # Timing
-    opened_at = models.DateTimeField(db_index=True)
+    opened_at = models.DateTimeField()
     closed_at = models.DateTimeField(null=True, blank=True, db_index=True)
     
     # Close reason
@@ -353,6 +358,10 @@ class TradeTransaction(TimeStampedModel):
             models.Index(fields=['trade_account', '-opened_at']),
             models.Index(fields=['symbol', 'opened_at']),
             models.Index(fields=['position_status', '-opened_at']),
+            models.Index(fields=['-opened_at', '-id']),
+            models.Index(fields=['trade_account', 'position_status', 'is_active', '-opened_at']),
+            models.Index(fields=['trade_account', 'position_status', '-closed_at']),
+            models.Index(fields=['mt5_order_id', 'trade_account']),
         ]
 
     def __str__(self):
@@ -407,19 +416,54 @@ class SubscriptionPayment(TimeStampedModel):
         verbose_name = 'Subscription Payment'
         verbose_name_plural = 'Subscription Payments'
         ordering = ['-payment_date']
+        indexes = [
+            models.Index(fields=['-payment_date', '-id']),
+            models.Index(fields=['payment_status', '-payment_date']),
+            models.Index(fields=['user', '-payment_date']),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - ฿{self.payment_amount} ({self.payment_status})"
 
 
 # Bot API Key Model (Master key for MT5 bot system)
+def generate_api_key():
+    """Return a 64-character URL-safe key built from 48 random bytes"""
+    return base64.urlsafe_b64encode(os.urandom(48)).decode('ascii')
+
+
+class BotAPIKeyQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        """bulk_create() skips save(), so fill in the key and its masked ends here"""
+        objs = list(objs)
+        for obj in objs:
+            obj.set_key_ends()
+        return super().bulk_create(objs, *args, **kwargs)
+
+
 class BotAPIKey(TimeStampedModel):
     key = models.CharField(
         max_length=64,
         unique=True,
         db_index=True,
+        default=generate_api_key,
+        editable=False,
         help_text="Master API key for bot authentication"
     )
+    key_prefix = models.CharField(
+        max_length=8,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="First characters of the key, shown and searched in the admin"
+    )
+    key_suffix = models.CharField(
+        max_length=8,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="Last characters of the key, shown and searched in the admin"
+    )
     name = models.CharField(
         max_length=100,
         help_text="Descriptive name for this API key"
@@ -430,6 +474,8 @@ class BotAPIKey(TimeStampedModel):
         help_text="Last time this API key was used"
     )
 
+    objects = BotAPIKeyQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Bot API Key'
         verbose_name_plural = 'Bot API Keys'
@@ -438,6 +484,17 @@ class BotAPIKey(TimeStampedModel):
     def __str__(self):
         return f"{self.name} ({'Active' if self.is_active else 'Inactive'})"
 
+    def set_key_ends(self):
+        """Store the masked ends of the key, generating one if it was explicitly left blank"""
+        if not self.key:
+            self.key = generate_api_key()
+        self.key_prefix = self.key[:8]
+        self.key_suffix = self.key[-8:]
+
+    def save(self, *args, **kwargs):
+        self.set_key_ends()
+        super().save(*args, **kwargs)
+
 
 # Bot Strategy Model
 class BotStrategy(TimeStampedModel):
@@ -519,8 +576,8 @@ class BotStrategy(TimeStampedModel):
         return f"{self.name} v{self.version}{pair_indicator} ({self.get_status_display()})"
     
     def get_latest_backtest(self):
-        """Get the most recent backtest result"""
-        return self.backtest_results.filter(is_latest=True).first()
+        """Get the most recent backtest result, leaving its raw_data payload unloaded"""
+        return self.backtest_results.filter(is_latest=True).defer('raw_data').first()
     
     def validate_symbol_format(self, symbol):
         """
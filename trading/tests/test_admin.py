@@ -0,0 +1,105 @@
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.test import TestCase, RequestFactory
+from django.utils import timezone
+from datetime import timedelta
+from decimal import Decimal
+
+from trading.admin import BotStrategyListFilter
+from trading.models import SubscriptionPackage, UserTradeAccount, TradeTransaction, BotAPIKey
+
+
+class TradeTransactionAdminTestCase(TestCase):
+    """Test cases for the trade transaction admin"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(username='trader', password='testpass123')
+        self.package = SubscriptionPackage.objects.create(
+            name='Test Package',
+            description='Test subscription package',
+            duration_days=30,
+            price=Decimal('1000.00')
+        )
+        self.numeric_account = self.create_account('55500777', '55500777')
+        self.other_account = self.create_account('Other Account', '12345678')
+        self.account_trade = self.create_trade(self.numeric_account, 111)
+        self.ticket_trade = self.create_trade(self.other_account, 55500777)
+        self.unrelated_trade = self.create_trade(self.other_account, 222)
+        
+        self.model_admin = admin.site._registry[TradeTransaction]
+        self.request = RequestFactory().get('/admin/trading/tradetransaction/')
+    
+    def create_account(self, account_name, mt5_account_id):
+        return UserTradeAccount.objects.create(
+            user=self.user,
+            account_name=account_name,
+            mt5_account_id=mt5_account_id,
+            broker_name='Test Broker',
+            mt5_server='TestBroker-Demo',
+            subscription_package=self.package,
+            subscription_start=timezone.now(),
+            subscription_expiry=timezone.now() + timedelta(days=30)
+        )
+    
+    def create_trade(self, trade_account, mt5_order_id):
+        return TradeTransaction.objects.create(
+            trade_account=trade_account,
+            mt5_order_id=mt5_order_id,
+            symbol='EURUSD',
+            position_type='BUY',
+            opened_at=timezone.now(),
+            entry_price=Decimal('1.0850'),
+            lot_size=Decimal('0.10')
+        )
+    
+    def search(self, term):
+        results, _ = self.model_admin.get_search_results(
+            self.request, TradeTransaction.objects.all(), term
+        )
+        return set(results.values_list('id', flat=True))
+    
+    def test_numeric_search_matches_ticket_and_search_fields(self):
+        """Test a numeric term finds the exact ticket as well as regular search field matches"""
+        self.assertEqual(self.search('55500777'), {self.account_trade.id, self.ticket_trade.id})
+    
+    def test_numeric_search_matches_ticket_only(self):
+        """Test a ticket number that matches no search field still finds its trade"""
+        self.assertEqual(self.search('222'), {self.unrelated_trade.id})
+    
+    def test_bot_strategy_filter_empty_choice(self):
+        """Test the bot strategy filter offers and applies an empty-value choice"""
+        list_filter = BotStrategyListFilter(
+            self.request, {'bot_strategy': 'none'}, TradeTransaction, self.model_admin
+        )
+        self.assertIn(('none', '-'), list(list_filter.lookup_choices))
+        self.assertEqual(
+            set(list_filter.queryset(self.request, TradeTransaction.objects.all()).values_list('id', flat=True)),
+            {self.account_trade.id, self.ticket_trade.id, self.unrelated_trade.id}
+        )
+
+
+class BotAPIKeyAdminTestCase(TestCase):
+    """Test cases for the bot API key admin"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.api_key = BotAPIKey.objects.create(name='Master Key')
+        self.other_key = BotAPIKey.objects.create(name='Other Key')
+        self.model_admin = admin.site._registry[BotAPIKey]
+        self.request = RequestFactory().get('/admin/trading/botapikey/')
+    
+    def search(self, term):
+        results, _ = self.model_admin.get_search_results(
+            self.request, BotAPIKey.objects.all(), term
+        )
+        return set(results.values_list('id', flat=True))
+    
+    def test_search_matches_key_ends(self):
+        """Test the start of the masked key prefix or suffix finds the key"""
+        self.assertIn(self.api_key.id, self.search(self.api_key.key[:6]))
+        self.assertIn(self.api_key.id, self.search(self.api_key.key[-8:-2]))
+    
+    def test_search_matches_name(self):
+        """Test regular name search still works"""
+        self.assertEqual(self.search('Master'), {self.api_key.id})
@@ -332,7 +332,37 @@ class BotAPITestCase(TestCase):
         account_data = data['data']
         self.assertGreaterEqual(account_data['days_remaining'], 9)
         self.assertLessEqual(account_data['days_remaining'], 10)
-    
+
+    def test_get_account_config_reflects_order_sync(self):
+        """Test account config returns a balance synced through the orders endpoint"""
+        response = self.client.get(
+            '/api/bot/account/12345678/config/',
+            **self.api_headers
+        )
+        self.assertEqual(Decimal(response.json()['data']['current_balance']), Decimal('10000.00'))
+
+        order_data = {
+            'mt5_account_id': '12345678',
+            'mt5_order_id': 987654321,
+            'symbol': 'EURUSD',
+            'position_type': 'BUY',
+            'opened_at': '2025-11-19T10:30:00Z',
+            'entry_price': '1.0850',
+            'lot_size': '0.10',
+            'current_balance': '10050.25'
+        }
+        self.client.post(
+            '/api/bot/orders/',
+            data=json.dumps(order_data),
+            **self.api_headers
+        )
+
+        response = self.client.get(
+            '/api/bot/account/12345678/config/',
+            **self.api_headers
+        )
+        self.assertEqual(Decimal(response.json()['data']['current_balance']), Decimal('10050.25'))
+
     def test_bot_heartbeat_success(self):
         """Test sending bot heartbeat successfully with trade config and strategy parameters"""
         # Create bot strategy
@@ -583,6 +613,23 @@ class BotAPITestCase(TestCase):
         data = response.json()
         self.assertEqual(data['status'], 'error')
     
+    def test_deactivated_api_key_rejected_after_use(self):
+        """Test that deactivating an API key takes effect without relying on cache invalidation"""
+        response = self.client.get(
+            '/api/bot/account/12345678/config/',
+            **self.api_headers
+        )
+        self.assertEqual(response.status_code, 200)
+        
+        # A queryset update sends no signals, like a change made through another worker
+        BotAPIKey.objects.filter(pk=self.api_key.pk).update(is_active=False)
+        
+        response = self.client.get(
+            '/api/bot/account/12345678/config/',
+            **self.api_headers
+        )
+        self.assertEqual(response.status_code, 401)
+    
     def test_api_key_last_used_update(self):
         """Test that API key last_used is updated on use"""
         old_last_used = self.api_key.last_used
@@ -599,7 +646,28 @@ class BotAPITestCase(TestCase):
         self.assertIsNotNone(self.api_key.last_used)
         if old_last_used:
             self.assertGreater(self.api_key.last_used, old_last_used)
-    
+
+    def test_api_key_generated_outside_admin(self):
+        """Test that an API key created through the ORM gets a usable key"""
+        generated_key = BotAPIKey.objects.create(name='Generated Bot Key')
+
+        self.assertEqual(len(generated_key.key), 64)
+
+        response = self.client.get(
+            '/api/bot/account/12345678/config/',
+            HTTP_AUTHORIZATION=f'Bearer {generated_key.key}'
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_api_key_bulk_create_sets_masked_ends(self):
+        """Test that API keys written with bulk_create get their searchable prefix and suffix"""
+        created = BotAPIKey.objects.bulk_create([BotAPIKey(name='Bulk Bot Key')])
+        
+        bulk_key = BotAPIKey.objects.get(pk=created[0].pk)
+        self.assertEqual(bulk_key.key_prefix, bulk_key.key[:8])
+        self.assertEqual(bulk_key.key_suffix, bulk_key.key[-8:])
+
     def test_invalid_json_body(self):
         """Test API call with invalid JSON"""
         response = self.client.post(
@@ -681,6 +749,123 @@ class BotAPITestCase(TestCase):
         if old_last_sync:
             self.assertGreater(self.trade_account.last_sync_datetime, old_last_sync)
 
+    def test_batch_create_and_update_orders(self):
+        """Test batch endpoint creates new orders, updates existing ones and syncs balance"""
+        existing = TradeTransaction.objects.create(
+            trade_account=self.trade_account,
+            mt5_order_id=111,
+            symbol='EURUSD',
+            position_type='BUY',
+            position_status='OPEN',
+            opened_at=timezone.now(),
+            entry_price=Decimal('1.0850'),
+            lot_size=Decimal('0.10')
+        )
+
+        orders = [
+            {
+                'mt5_account_id': '12345678',
+                'mt5_order_id': 111,
+                'position_status': 'CLOSED',
+                'closed_at': '2025-11-19T11:30:00Z',
+                'profit_loss': '25.50'
+            },
+            {
+                'mt5_account_id': '12345678',
+                'mt5_order_id': 222,
+                'symbol': 'GBPUSD',
+                'position_type': 'SELL',
+                'opened_at': '2025-11-19T10:30:00Z',
+                'entry_price': '1.2650',
+                'lot_size': '0.20',
+                'current_balance': '10025.50'
+            },
+            {
+                'mt5_account_id': '99999999',
+                'mt5_order_id': 333
+            }
+        ]
+
+        response = self.client.post(
+            '/api/bot/orders/batch/',
+            data=json.dumps(orders),
+            **self.api_headers
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual(results['created'], 1)
+        self.assertEqual(results['updated'], 1)
+        self.assertEqual(results['failed'], 1)
+
+        existing.refresh_from_db()
+        self.assertEqual(existing.position_status, 'CLOSED')
+        self.assertEqual(existing.profit_loss, Decimal('25.50'))
+
+        created = TradeTransaction.objects.get(trade_account=self.trade_account, mt5_order_id=222)
+        self.assertEqual(created.symbol, 'GBPUSD')
+        self.assertEqual(created.lot_size, Decimal('0.20'))
+
+        self.trade_account.refresh_from_db()
+        self.assertEqual(self.trade_account.current_balance, Decimal('10025.50'))
+        self.assertIsNotNone(self.trade_account.last_sync_datetime)
+
+    def test_batch_duplicate_new_order_created_once(self):
+        """Test a new order repeated within one batch is created once with the latest values"""
+        order = {
+            'mt5_account_id': '12345678',
+            'mt5_order_id': 444,
+            'symbol': 'EURUSD',
+            'position_type': 'BUY',
+            'opened_at': '2025-11-19T10:30:00Z',
+            'entry_price': '1.0850',
+            'lot_size': '0.10'
+        }
+
+        response = self.client.post(
+            '/api/bot/orders/batch/',
+            data=json.dumps([order, {**order, 'profit_loss': '12.00'}]),
+            **self.api_headers
+        )
+
+        self.assertEqual(response.status_code, 200)
+        orders = TradeTransaction.objects.filter(trade_account=self.trade_account, mt5_order_id=444)
+        self.assertEqual(orders.count(), 1)
+        self.assertEqual(orders.get().profit_loss, Decimal('12.00'))
+
+    def test_batch_invalid_orders_fail_individually(self):
+        """Test orders that overflow their columns are reported as failed without blocking the rest"""
+        order = {
+            'mt5_account_id': '12345678',
+            'mt5_order_id': 555,
+            'symbol': 'EURUSD',
+            'position_type': 'BUY',
+            'opened_at': '2025-11-19T10:30:00Z',
+            'entry_price': '1.0850',
+            'lot_size': '0.10'
+        }
+        orders = [
+            order,
+            {**order, 'mt5_order_id': 556, 'lot_size': '1e20'},
+            {**order, 'mt5_order_id': 557, 'symbol': 'X' * 21},
+            {**order, 'mt5_order_id': '558.5'},
+        ]
+
+        response = self.client.post(
+            '/api/bot/orders/batch/',
+            data=json.dumps(orders),
+            **self.api_headers
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual(results['created'], 1)
+        self.assertEqual([f['index'] for f in results['failed']], [1, 2, 3])
+        self.assertEqual(
+            list(TradeTransaction.objects.filter(trade_account=self.trade_account).values_list('mt5_order_id', flat=True)),
+            [555]
+        )
+
 
 class BotStrategyAPITestCase(TestCase):
     """Test cases for Bot Strategy API endpoints"""
@@ -2,6 +2,9 @@ from django.urls import path, include
 from . import views
 
 urlpatterns = [
+    # Bot API (first: bot traffic is the bulk of requests)
+    path('api/bot/', include('trading.api.urls')),
+    
     # Authentication
     path('', views.welcome_view, name='welcome'),
     path('login/', views.login_view, name='login'),
@@ -42,7 +45,4 @@ urlpatterns = [
     path('account/<int:account_id>/bot/config/', views.account_update_bot_config, name='account_update_bot_config'),
     path('account/<int:account_id>/bot/pause/', views.account_bot_pause_view, name='account_bot_pause'),
     path('account/<int:account_id>/bot/resume/', views.account_bot_resume_view, name='account_bot_resume'),
-    
-    # Bot API
-    path('api/bot/', include('trading.api.urls')),
 ]
@@ -22,6 +22,8 @@ from .models import (
     PaymentStatus
 )
 
+LINE_API_TIMEOUT = 10  # seconds
+
 
 # ============================================
 # Authentication Views
@@ -169,20 +171,22 @@ def line_callback_view(request):
             'client_secret': settings.LINE_CHANNEL_SECRET,
         }
         
-        token_response = requests.post(token_url, data=token_data)
-        token_response.raise_for_status()
-        token_json = token_response.json()
-        access_token = token_json.get('access_token')
-        
-        if not access_token:
-            raise Exception('ไม่สามารถรับ access token จาก LINE')
-        
-        # Get user profile from LINE
-        profile_url = 'https://api.line.me/v2/profile'
-        headers = {'Authorization': f'Bearer {access_token}'}
-        profile_response = requests.get(profile_url, headers=headers)
-        profile_response.raise_for_status()
-        profile = profile_response.json()
+        # Per-login session: the profile fetch reuses the token exchange's connection
+        with requests.Session() as line_session:
+            token_response = line_session.post(token_url, data=token_data, timeout=LINE_API_TIMEOUT)
+            token_response.raise_for_status()
+            token_json = token_response.json()
+            access_token = token_json.get('access_token')
+            
+            if not access_token:
+                raise Exception('ไม่สามารถรับ access token จาก LINE')
+            
+            # Get user profile from LINE
+            profile_url = 'https://api.line.me/v2/profile'
+            headers = {'Authorization': f'Bearer {access_token}'}
+            profile_response = line_session.get(profile_url, headers=headers, timeout=LINE_API_TIMEOUT)
+            profile_response.raise_for_status()
+            profile = profile_response.json()
         
         line_user_id = profile.get('userId')
         display_name = profile.get('displayName', '')